@@ -3,30 +3,108 @@
 Simplified PDF Merge and Email System
 """
 
+import io
 import os
+import re
 import sys
 import time
+import atexit
 import logging
+import logging.handlers
+import shutil
+import itertools
 import configparser
+from contextlib import ExitStack
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
-# PDF Processing
-try:
-    from PyPDF2 import PdfReader, PdfWriter
-except ImportError:
-    print("ERROR: PyPDF2 not installed. Run: pip install PyPDF2")
-    sys.exit(1)
+# PDF (pikepdf/qpdf preferred, PyPDF2 as fallback), email, gzip and thread
+# pool modules are imported where they are used, so runs with nothing to
+# merge start fast.
 
-# Email
-import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.mime.application import MIMEApplication
+# Raw bytes per base64 line of the attachment: 57 bytes -> 76 chars (RFC 2045)
+B64_LINE_BYTES = 57
+# Attachment bytes read and sent per write; a whole number of base64 lines
+B64_CHUNK_BYTES = B64_LINE_BYTES * 1024
+# Seconds to wait on the SMTP server before giving up on a reply
+SMTP_TIMEOUT = 60
+
+def _gzip_rotator(source, dest):
+    """Compress a rotated log segment into dest"""
+    import gzip
+    
+    with open(source, 'rb') as src, gzip.open(dest, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+def _deflated_reader(pdf_file):
+    """Open a PDF with PyPDF2 and flate-compress page content stored unfiltered"""
+    from PyPDF2 import PdfReader
+    from PyPDF2.generic import NameObject, StreamObject
+    
+    reader = PdfReader(pdf_file)
+    # Only a single unfiltered content stream is packed: flate_encode() works on
+    # the raw bytes without parsing operators, and PyPDF2 cannot copy direct
+    # streams inside a /Contents array. This runs before the pages are copied,
+    # since streams set on pages owned by a PdfWriter stay direct (invalid) objects
+    for page in reader.pages:
+        contents = page.get_contents()
+        if isinstance(contents, StreamObject) and '/Filter' not in contents:
+            page[NameObject('/Contents')] = contents.flate_encode()
+    return reader
+
+def _page_count(pdf_file):
+    """Parse a PDF with whichever library is installed and return its page count"""
+    try:
+        import pikepdf
+    except ImportError:
+        from PyPDF2 import PdfReader
+        return len(PdfReader(pdf_file).pages)
+    with pikepdf.open(pdf_file) as pdf:
+        return len(pdf.pages)
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Configuration values, resolved once from config.ini"""
+    source_folder: str = 'incoming_pdfs'
+    archive_folder: str = 'archive'
+    merged_folder: str = 'merged_pdfs'
+    smtp_server: str = ''
+    smtp_port: int = 587
+    sender_email: str = ''
+    sender_password: str = field(default='', repr=False)
+    recipients: tuple = ()
+    subject: str = 'Daily Merged PDF'
+    body: str = 'Please find attached the merged PDF.'
+    
+    @classmethod
+    def from_sections(cls, sections):
+        """Build settings from parsed config sections, falling back to the defaults"""
+        paths = sections.get('PATHS', {})
+        email_cfg = sections.get('EMAIL', {})
+        defaults = cls()
+        get = lambda section, name: section.get(name, getattr(defaults, name))
+        
+        return cls(
+            source_folder=get(paths, 'source_folder'),
+            archive_folder=get(paths, 'archive_folder'),
+            merged_folder=get(paths, 'merged_folder'),
+            smtp_server=get(email_cfg, 'smtp_server'),
+            smtp_port=int(get(email_cfg, 'smtp_port')),
+            sender_email=get(email_cfg, 'sender_email'),
+            sender_password=get(email_cfg, 'sender_password'),
+            recipients=tuple(r.strip() for r in email_cfg.get('recipients', '').split(',') if r.strip()),
+            subject=get(email_cfg, 'subject'),
+            body=get(email_cfg, 'body'),
+        )
 
 class SimplePDFMerger:
     """Simple PDF Merger and Email Sender"""
     
+    # Logged-in SMTP session reused across sends: (settings key, connection)
+    _smtp = None
+    
     def __init__(self):
         self.setup_directories()
         self.setup_logging()
@@ -41,14 +119,29 @@ class SimplePDFMerger:
     
     def setup_logging(self):
         """Setup logging system"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('logs/pdf_processor.log'),
-                logging.StreamHandler(sys.stdout)
-            ]
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        
+        # Buffer records and write them to the log file in batches; the file
+        # rotates at 10 MB, keeping 5 gzipped segments
+        file_handler = logging.handlers.RotatingFileHandler(
+            'logs/pdf_processor.log', maxBytes=10 * 1024 * 1024, backupCount=5, delay=True
         )
+        file_handler.namer = lambda name: name + '.gz'
+        file_handler.rotator = _gzip_rotator
+        file_handler.setFormatter(formatter)
+        self.log_buffer = logging.handlers.MemoryHandler(
+            capacity=1024, flushLevel=logging.WARNING, target=file_handler
+        )
+        atexit.register(self.log_buffer.flush)
+        handlers = [self.log_buffer]
+        
+        # Only echo to the console when someone is watching it
+        if sys.stdout is not None and sys.stdout.isatty():
+            console = logging.StreamHandler(sys.stdout)
+            console.setFormatter(formatter)
+            handlers.append(console)
+        
+        logging.basicConfig(level=logging.INFO, handlers=handlers)
         self.logger = logging.getLogger('PDFProcessor')
         self.logger.info("PDF Processor started")
     
@@ -59,110 +152,212 @@ class SimplePDFMerger:
             print("Please copy config.ini.template to config.ini and edit it")
             sys.exit(1)
         
-        self.config = configparser.ConfigParser()
-        self.config.read('config.ini')
+        parser = configparser.ConfigParser()
+        parser.read('config.ini')
+        sections = {name: dict(parser[name]) for name in parser.sections()}
         
-        # Get settings with defaults
-        self.source_folder = self.config.get('PATHS', 'source_folder', fallback='incoming_pdfs')
-        self.archive_folder = self.config.get('PATHS', 'archive_folder', fallback='archive')
-        self.merged_folder = self.config.get('PATHS', 'merged_folder', fallback='merged_pdfs')
+        # Resolve every setting once, with defaults
+        try:
+            self.settings = Settings.from_sections(sections)
+        except ValueError as e:
+            print(f"ERROR: Invalid value in config.ini: {e}")
+            sys.exit(1)
         
         self.logger.info("Configuration loaded successfully")
     
     def find_pdf_files(self):
         """Find all PDF files in source folder"""
-        pdf_files = []
-        source_path = Path(self.source_folder)
-        
-        if not source_path.exists():
-            self.logger.error(f"Source folder not found: {self.source_folder}")
-            return pdf_files
+        try:
+            # DirEntry.is_file() answers from the cached d_type, no extra stat
+            with os.scandir(self.settings.source_folder) as entries:
+                pdf_entries = [entry for entry in entries
+                               if entry.name.lower().endswith('.pdf') and entry.is_file()]
+        except FileNotFoundError:
+            self.logger.error(f"Source folder not found: {self.settings.source_folder}")
+            return []
+        except OSError as e:
+            self.logger.error(f"Cannot read source folder {self.settings.source_folder}: {e}")
+            return []
         
-        for file in source_path.glob("*.pdf"):
-            pdf_files.append(str(file))
+        # Sort on the bare file name; every path shares the folder prefix
+        pdf_entries.sort(key=lambda entry: entry.name)
         
-        self.logger.info(f"Found {len(pdf_files)} PDF files")
-        return sorted(pdf_files)
+        self.logger.info(f"Found {len(pdf_entries)} PDF files")
+        return [entry.path for entry in pdf_entries]
     
     def merge_pdfs(self, pdf_files):
-        """Merge PDF files into one"""
+        """Merge PDF files into one, returning (output path, files actually merged)"""
         if not pdf_files:
             self.logger.warning("No PDF files to merge")
-            return None
+            return None, []
         
         try:
-            merger = PdfWriter()
+            # Create output filename
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_file = f"merged_{timestamp}.pdf"
+            output_path = os.path.join(self.settings.merged_folder, output_file)
             
+            if len(pdf_files) == 1:
+                merged_files = self._link_single(pdf_files[0], output_path)
+            else:
+                try:
+                    import pikepdf  # noqa: F401
+                except ImportError:
+                    merged_files = self._merge_pypdf2(pdf_files, output_path)
+                else:
+                    merged_files = self._merge_pikepdf(pdf_files, output_path)
+            
+            if not merged_files:
+                self.logger.error("None of the PDF files could be read")
+                return None, []
+            
+            skipped = len(pdf_files) - len(merged_files)
+            if skipped:
+                self.logger.warning(f"{skipped} unreadable files left in {self.settings.source_folder}")
+            
+            self.logger.info(f"✓ Merged {len(merged_files)} files into {output_file}")
+            return output_path, merged_files
+            
+        except ImportError:
+            self.logger.error("No PDF library installed. Run: pip install pikepdf")
+            return None, []
+        except Exception as e:
+            self.logger.error(f"Error merging PDFs: {e}")
+            return None, []
+    
+    def _link_single(self, pdf_file, output_path):
+        """Put a lone PDF in place as-is, hard-linking it where the filesystem allows"""
+        # Parse it first, so an unreadable file stays in the source folder
+        try:
+            _page_count(pdf_file)
+        except ImportError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Error reading {pdf_file}: {e}")
+            return []
+        
+        try:
+            os.link(pdf_file, output_path)
+        except OSError:
+            # Different filesystem or no hard-link support
+            shutil.copyfile(pdf_file, output_path)
+        self.logger.info(f"Added: {os.path.basename(pdf_file)}")
+        return [pdf_file]
+    
+    def _merge_pikepdf(self, pdf_files, output_path):
+        """Merge with pikepdf, letting qpdf copy the page objects"""
+        import pikepdf
+        
+        merged_files = []
+        with pikepdf.Pdf.new() as merged, ExitStack() as sources:
             for pdf_file in pdf_files:
                 try:
-                    reader = PdfReader(pdf_file)
-                    for page in reader.pages:
-                        merger.add_page(page)
+                    # Sources must stay open until the merged PDF is saved, so
+                    # open them from memory rather than holding a descriptor each
+                    with open(pdf_file, 'rb') as f:
+                        data = io.BytesIO(f.read())
+                    src = sources.enter_context(pikepdf.open(data))
+                    merged.pages.extend(src.pages)
+                    merged_files.append(pdf_file)
                     self.logger.info(f"Added: {os.path.basename(pdf_file)}")
                 except Exception as e:
                     self.logger.error(f"Error reading {pdf_file}: {e}")
                     continue
             
-            # Create output filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = f"merged_{timestamp}.pdf"
-            output_path = os.path.join(self.merged_folder, output_file)
-            
-            # Save merged PDF
-            with open(output_path, 'wb') as output:
-                merger.write(output)
+            if not merged_files:
+                return merged_files
             
-            self.logger.info(f"✓ Merged {len(pdf_files)} files into {output_file}")
-            return output_path
-            
-        except Exception as e:
-            self.logger.error(f"Error merging PDFs: {e}")
-            return None
+            # Object streams plus flate-recompressed content keep the output small
+            merged.save(output_path, linearize=False,
+                        object_stream_mode=pikepdf.ObjectStreamMode.generate,
+                        compress_streams=True,
+                        stream_decode_level=pikepdf.StreamDecodeLevel.generalized)
+        return merged_files
+    
+    def _merge_pypdf2(self, pdf_files, output_path):
+        """Merge with PyPDF2 when pikepdf is unavailable"""
+        from PyPDF2 import PdfWriter
+        
+        merger = PdfWriter()
+        merged_files = []
+        for pdf_file in pdf_files:
+            try:
+                # PdfReader reads a path into memory in one call and closes it
+                merger.append(_deflated_reader(pdf_file))
+                merged_files.append(pdf_file)
+                self.logger.info(f"Added: {os.path.basename(pdf_file)}")
+            except Exception as e:
+                self.logger.error(f"Error reading {pdf_file}: {e}")
+                continue
+        
+        if not merged_files:
+            return merged_files
+        
+        # Save merged PDF
+        with open(output_path, 'wb') as output:
+            merger.write(output)
+        return merged_files
     
     def send_email(self, attachment_path):
         """Send email with merged PDF"""
         try:
-            # Get email settings
-            smtp_server = self.config.get('EMAIL', 'smtp_server', fallback='')
-            smtp_port = self.config.getint('EMAIL', 'smtp_port', fallback=587)
-            sender_email = self.config.get('EMAIL', 'sender_email', fallback='')
-            sender_password = self.config.get('EMAIL', 'sender_password', fallback='')
+            import smtplib
+            import uuid
+            from email.mime.multipart import MIMEMultipart
+            from email.mime.text import MIMEText
             
-            if not smtp_server or not sender_email:
+            settings = self.settings
+            if not settings.smtp_server or not settings.sender_email:
                 self.logger.warning("Email configuration incomplete. Skipping email.")
                 return False
             
-            # Get recipients
-            recipients_str = self.config.get('EMAIL', 'recipients', fallback='')
-            if not recipients_str:
+            recipients = list(settings.recipients)
+            if not recipients:
                 self.logger.warning("No recipients configured. Skipping email.")
                 return False
             
-            recipients = [r.strip() for r in recipients_str.split(',')]
-            
-            # Create email
-            msg = MIMEMultipart()
-            msg['From'] = sender_email
+            # Create email (the attachment itself is streamed from disk on send)
+            boundary = f"=============== {uuid.uuid4().hex}"
+            msg = MIMEMultipart(boundary=boundary)
+            msg['From'] = settings.sender_email
             msg['To'] = ', '.join(recipients)
-            msg['Subject'] = self.config.get('EMAIL', 'subject', fallback='Daily Merged PDF')
+            msg['Subject'] = settings.subject
             
             # Add body
-            body = self.config.get('EMAIL', 'body', fallback='Please find attached the merged PDF.')
-            msg.attach(MIMEText(body, 'plain'))
+            msg.attach(MIMEText(settings.body, 'plain'))
+            
+            if not (attachment_path and os.path.exists(attachment_path)):
+                attachment_path = None
             
-            # Add attachment
-            if attachment_path and os.path.exists(attachment_path):
-                with open(attachment_path, 'rb') as f:
-                    part = MIMEApplication(f.read(), Name=os.path.basename(attachment_path))
-                part['Content-Disposition'] = f'attachment; filename="{os.path.basename(attachment_path)}"'
-                msg.attach(part)
+            # Render before DATA, so an encoding error can't strand the session mid-message
+            head, tail = self._render_message(msg, attachment_path)
             
             # Send email
-            with smtplib.SMTP(smtp_server, smtp_port) as server:
-                server.starttls()
-                if sender_password:
-                    server.login(sender_email, sender_password)
-                server.send_message(msg)
+            login = (settings.smtp_server, settings.smtp_port,
+                     settings.sender_email, settings.sender_password)
+            try:
+                server, reused = self._smtp_connection(*login)
+                try:
+                    self._begin_message(server, settings.sender_email, recipients)
+                except smtplib.SMTPServerDisconnected:
+                    if not reused:
+                        raise
+                    # The cached session was dropped before any message data
+                    # went out, so reconnecting cannot deliver the mail twice
+                    self._close_smtp()
+                    server, _ = self._smtp_connection(*login)
+                    self._begin_message(server, settings.sender_email, recipients)
+            except Exception:
+                # Session state is unknown after a failed send, don't reuse it
+                self._close_smtp()
+                raise
+            
+            try:
+                self._stream_message(server, head, tail, attachment_path)
+            except Exception:
+                # Past DATA a QUIT would be read as message text; just drop the connection
+                self._close_smtp(graceful=False)
+                raise
             
             self.logger.info(f"✓ Email sent to {len(recipients)} recipients")
             return True
@@ -171,26 +366,179 @@ class SimplePDFMerger:
             self.logger.error(f"Error sending email: {e}")
             return False
     
+    def _smtp_connection(self, smtp_server, smtp_port, sender_email, sender_password):
+        """Return (logged-in SMTP session, whether it was reused from the cache)"""
+        import smtplib
+        
+        key = (smtp_server, smtp_port, sender_email, sender_password)
+        if SimplePDFMerger._smtp is not None:
+            cached_key, server = SimplePDFMerger._smtp
+            if cached_key == key:
+                return server, True
+            self._close_smtp()
+        
+        server = smtplib.SMTP(smtp_server, smtp_port, timeout=SMTP_TIMEOUT)
+        try:
+            server.starttls()
+            if sender_password:
+                server.login(sender_email, sender_password)
+        except Exception:
+            server.close()
+            raise
+        
+        if SimplePDFMerger._smtp is None:
+            atexit.register(SimplePDFMerger._close_smtp)
+        SimplePDFMerger._smtp = (key, server)
+        return server, False
+    
+    @staticmethod
+    def _close_smtp(graceful=True):
+        """Close the cached SMTP session, if any, sending QUIT first when graceful"""
+        if SimplePDFMerger._smtp is None:
+            return
+        _, server = SimplePDFMerger._smtp
+        SimplePDFMerger._smtp = None
+        if not graceful:
+            server.close()
+            return
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+    
+    def _begin_message(self, server, sender, recipients):
+        """Issue MAIL FROM, RCPT TO and DATA, leaving the session ready for the message"""
+        import smtplib
+        
+        server.ehlo_or_helo_if_needed()
+        if server.has_extn('pipelining'):
+            # Send MAIL FROM and every RCPT TO in one write, then read the replies
+            commands = [f"mail FROM:{smtplib.quoteaddr(sender)}"]
+            commands += [f"rcpt TO:{smtplib.quoteaddr(recipient)}" for recipient in recipients]
+            server.send(''.join(command + '\r\n' for command in commands))
+            replies = [server.getreply() for _ in commands]
+        else:
+            replies = [server.mail(sender)] + [server.rcpt(recipient) for recipient in recipients]
+        
+        code, resp = replies[0]
+        if code != 250:
+            server.rset()
+            raise smtplib.SMTPSenderRefused(code, resp, sender)
+        
+        refused = {}
+        for recipient, (code, resp) in zip(recipients, replies[1:]):
+            if code not in (250, 251):
+                refused[recipient] = (code, resp)
+        if len(refused) == len(recipients):
+            server.rset()
+            raise smtplib.SMTPRecipientsRefused(refused)
+        
+        code, resp = server.docmd('DATA')
+        if code != 354:
+            server.rset()
+            raise smtplib.SMTPDataError(code, resp)
+    
+    def _render_message(self, msg, attachment_path):
+        """Return (head, tail) wire bytes framing the streamed attachment body"""
+        from email.mime.base import MIMEBase
+        
+        # Same policy send_message() uses, so non-ASCII headers get RFC 2047 encoding
+        policy = msg.policy.clone(linesep='\r\n')
+        
+        # Headers and text part, minus the closing delimiter
+        delimiter = b'--' + msg.get_boundary().encode('ascii')
+        head = msg.as_bytes(policy=policy)
+        head = re.sub(rb'(?m)^\.', b'..', head[:head.rindex(delimiter + b'--')])
+        
+        if attachment_path:
+            filename = os.path.basename(attachment_path)
+            part = MIMEBase('application', 'octet-stream', Name=filename)
+            part['Content-Transfer-Encoding'] = 'base64'
+            part['Content-Disposition'] = f'attachment; filename="{filename}"'
+            head += delimiter + b'\r\n' + part.as_bytes(policy=policy)
+        
+        return head, delimiter + b'--\r\n.\r\n'
+    
+    def _stream_message(self, server, head, tail, attachment_path):
+        """Send the rendered message after DATA, base64-encoding the attachment as it is read"""
+        import base64
+        import smtplib
+        
+        server.send(head)
+        if attachment_path:
+            # Base64 output never starts a line with '.', so no dot-stuffing needed
+            with open(attachment_path, 'rb') as f:
+                while chunk := f.read(B64_CHUNK_BYTES):
+                    server.send(base64.encodebytes(chunk).replace(b'\n', b'\r\n'))
+        server.send(tail)
+        code, resp = server.getreply()
+        if code != 250:
+            raise smtplib.SMTPDataError(code, resp)
+    
     def archive_files(self, pdf_files):
         """Move processed files to archive"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        # Resolve all target names against a single listing of the archive.
+        # Names compare case-insensitively, as on Windows and macOS filesystems,
+        # so a rename never hits (or silently replaces) a differently-cased file
+        try:
+            with os.scandir(self.settings.archive_folder) as entries:
+                existing = {entry.name.casefold() for entry in entries}
+        except OSError:
+            existing = set()
+        
+        moves = []
         for file in pdf_files:
-            try:
-                filename = os.path.basename(file)
-                archive_path = os.path.join(self.archive_folder, filename)
-                
-                # If file exists, add timestamp
-                if os.path.exists(archive_path):
-                    name, ext = os.path.splitext(filename)
-                    timestamp = datetime.now().strftime("%H%M%S")
-                    archive_path = os.path.join(self.archive_folder, f"{name}_{timestamp}{ext}")
-                
-                os.rename(file, archive_path)
-                self.logger.info(f"Archived: {filename}")
-            except Exception as e:
-                self.logger.error(f"Error archiving {file}: {e}")
+            filename = os.path.basename(file)
+            target = filename
+            
+            # If file exists, add the first free numeric suffix
+            if target.casefold() in existing:
+                name, ext = os.path.splitext(filename)
+                target = next(candidate for candidate in (f"{name}_{i}{ext}" for i in itertools.count(1))
+                              if candidate.casefold() not in existing)
+            
+            existing.add(target.casefold())
+            moves.append((file, os.path.join(self.settings.archive_folder, target)))
+        
+        if not moves:
+            return
+        
+        # Renames block in the kernel, so threads keep several in flight
+        with ThreadPoolExecutor(max_workers=min(32, len(moves))) as executor:
+            futures = [executor.submit(os.rename, src, dst) for src, dst in moves]
+            for (file, archive_path), future in zip(moves, futures):
+                try:
+                    future.result()
+                    filename, target = os.path.basename(file), os.path.basename(archive_path)
+                    if target == filename:
+                        self.logger.info(f"Archived: {filename}")
+                    else:
+                        self.logger.info(f"Archived: {filename} as {target}")
+                except Exception as e:
+                    self.logger.error(f"Error archiving {file}: {e}")
+    
+    def _send_and_archive(self, merged_file, pdf_files):
+        """Run send_email and archive_files concurrently, returning whether the email was sent"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            email_sent = executor.submit(self.send_email, merged_file)
+            archived = executor.submit(self.archive_files, pdf_files)
+            archived.result()
+            return email_sent.result()
     
     def run(self):
         """Main execution method"""
+        try:
+            return self._process()
+        finally:
+            # Write the buffered log out before main() waits at its prompt
+            self.log_buffer.flush()
+    
+    def _process(self):
+        """Find, merge, email and archive the incoming PDFs"""
         self.logger.info("=" * 50)
         self.logger.info("Starting PDF merge process")
         
@@ -201,19 +549,17 @@ class SimplePDFMerger:
             return False
         
         # Step 2: Merge PDFs
-        merged_file = self.merge_pdfs(pdf_files)
+        merged_file, merged_files = self.merge_pdfs(pdf_files)
         if not merged_file:
             self.logger.error("Failed to merge PDFs")
             return False
         
-        # Step 3: Send email
-        email_sent = self.send_email(merged_file)
-        
-        # Step 4: Archive files
-        self.archive_files(pdf_files)
+        # Step 3 & 4: Send email and archive files (independent, so overlapped);
+        # inputs that could not be read stay in the source folder
+        email_sent = self._send_and_archive(merged_file, merged_files)
         
         self.logger.info(f"Process completed successfully!")
-        self.logger.info(f"- Merged {len(pdf_files)} files")
+        self.logger.info(f"- Merged {len(merged_files)} files")
         self.logger.info(f"- Email sent: {'Yes' if email_sent else 'No'}")
         self.logger.info(f"- Output: {os.path.basename(merged_file)}")
         
@@ -228,11 +574,10 @@ def main():
     # Check dependencies
     try:
         import configparser
-        import PyPDF2
     except ImportError as e:
         print(f"\n Missing dependency: {e}")
         print("Please install required packages:")
-        print("pip install PyPDF2 configparser")
+        print("pip install -r requirements.txt")
         return
     
     # Run the processor
@@ -243,7 +588,7 @@ def main():
         print("\n Process completed successfully!")
         print("Check 'logs/pdf_processor.log' for details")
     else:
-        print("\n        pyinstaller --onefile --name pdf_merge_email --add-data "config.ini;." --add-data "incoming_pdfs;incoming_pdfs" --add-data "archive;archive" --add-data "merged_pdfs;merged_pdfs" --add-data "logs;logs" --hidden-import PyPDF2 --console [main.py](http://_vscodecontentref_/0) Process completed with errors")
+        print("\n Process completed with errors")
         print("Check 'logs/pdf_processor.log' for details")
     
     print("\nPress Enter to exit...")